@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
+import hashlib
+import html
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import zip_longest
 from pathlib import Path
-from typing import Iterable, List
+from typing import AbstractSet, Callable, Iterable, Iterator, List, Sequence
 
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import to_hex
+from matplotlib.figure import Figure
 import numpy as np
 import pandas as pd
 
@@ -37,100 +45,432 @@ SCORE_COLUMNS = [
     "Retention_Clarity_Score_0to5",
 ]
 
+DEFAULT_SUBPLOT_MARGINS = {
+    side: plt.rcParams[f"figure.subplot.{side}"]
+    for side in ("left", "right", "bottom", "top", "wspace", "hspace")
+}
 
-def available_columns(df: pd.DataFrame, columns: List[str]) -> List[str]:
-    """Return only the columns that are present in the DataFrame."""
-    return [column for column in columns if column in df.columns]
+
+def available_columns(present: AbstractSet[str], columns: List[str]) -> List[str]:
+    """Return only the columns found in ``present``.
+
+    Callers build ``present = frozenset(df.columns)`` once and reuse it for
+    every lookup on the same DataFrame.
+    """
+    return [column for column in columns if column in present]
+
+
+YES_NO_VALUES = {
+    "Yes": True,
+    "yes": True,
+    "YES": True,
+    "No": False,
+    "no": False,
+    "NO": False,
+}
 
 
 def yes_no_series(series: pd.Series) -> pd.Series:
-    """Normalize Yes/No string columns to boolean True/False values."""
-    return series.astype(str).str.strip().str.lower().eq("yes")
+    """Normalize Yes/No string columns to nullable boolean True/False values.
 
+    Exact spellings resolve through a single dictionary lookup; only the
+    leftover cells (stray whitespace, odd casing) pay for string cleanup.
+    Blank or unrecognised cells stay missing (``pd.NA``).
+    """
+    flags = series.map(YES_NO_VALUES).astype("boolean")
+    leftover = flags.isna() & series.notna()
+    if leftover.any():
+        normalized = series[leftover].astype(str).str.strip().str.lower()
+        flags[leftover] = normalized.map({"yes": True, "no": False}).astype("boolean")
+    return flags
 
-def build_dataframe(excel_source: Path) -> pd.DataFrame:
-    """Create the pandas DataFrame by loading the Excel sheet."""
+
+def _calamine_rows(excel_source: Path) -> Iterator[Sequence[object]]:
+    """Yield first-sheet rows using the Rust-backed calamine parser."""
+    from python_calamine import CalamineWorkbook
+
+    workbook = CalamineWorkbook.from_path(str(excel_source))
+    try:
+        for row in workbook.get_sheet_by_index(0).iter_rows():
+            # calamine reports empty cells as "" where openpyxl yields None.
+            yield tuple(None if value == "" else value for value in row)
+    finally:
+        workbook.close()
+
+
+def _openpyxl_rows(excel_source: Path) -> Iterator[Sequence[object]]:
+    """Yield first-sheet rows using openpyxl's read-only streaming mode."""
     try:
-        return pd.read_excel(excel_source)
+        from openpyxl import load_workbook
     except ImportError as exc:  # pragma: no cover - depends on local environment
         raise SystemExit(
-            "Reading .xlsx files requires the optional dependency 'openpyxl'. "
-            "Install it with `python -m pip install openpyxl` and re-run this script."
+            "Reading .xlsx files requires the optional dependency 'openpyxl' "
+            "(or 'python-calamine'). Install it with `python -m pip install openpyxl` "
+            "and re-run this script."
         ) from exc
 
+    workbook = load_workbook(excel_source, read_only=True, data_only=True)
+    try:
+        # Read sheet 0 like calamine and pd.read_excel, not whichever tab was
+        # last active; the stored <dimension> record may be stale, so it is
+        # dropped as pandas' own read-only reader does.
+        sheet = workbook.worksheets[0]
+        sheet.reset_dimensions()
+        yield from sheet.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def parquet_sidecar(excel_source: Path) -> Path:
+    """Return the Parquet cache path that sits next to an Excel workbook."""
+    return excel_source.with_suffix(".parquet")
+
+
+def column_names(header: Sequence[object]) -> List[object]:
+    """Name header cells the way ``pd.read_excel`` does.
+
+    Blank cells become ``Unnamed: <position>`` and repeated names get ``.1``,
+    ``.2``, ... suffixes so every column keeps its own data.
+    """
+    names: List[object] = []
+    counts: dict = {}
+    for position, name in enumerate(header):
+        if name is None:
+            name = f"Unnamed: {position}"
+        count = counts.get(name, 0)
+        while count > 0:
+            counts[name] = count + 1
+            name = f"{name}.{count}"
+            count = counts.get(name, 0)
+        counts[name] = count + 1
+        names.append(name)
+    return names
+
+
+def read_workbook(excel_source: Path) -> pd.DataFrame:
+    """Create the pandas DataFrame by streaming the first Excel sheet.
+
+    Rows are parsed lazily as plain values with python-calamine when it is
+    installed, falling back to openpyxl's read-only mode otherwise. Neither
+    path materializes styled cell objects.
+    """
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        rows = _openpyxl_rows(excel_source)
+    else:
+        rows = _calamine_rows(excel_source)
+
+    header = next(rows, ())
+    # Cells are collected by position so blank or repeated header names
+    # cannot merge two columns into one list.
+    columns: List[List[object]] = [[] for _ in header]
+    for row in rows:
+        if all(value is None for value in row):
+            continue
+        for values, value in zip_longest(columns, row[: len(header)]):
+            values.append(value)
+
+    df = pd.DataFrame(dict(enumerate(columns)))
+    df.columns = column_names(header)
+    # Counts and 0-5 scores fit in a single byte; narrow them from 64-bit.
+    # This is only a storage optimisation, so columns holding text (e.g.
+    # "unknown") are left as loaded rather than failing the load.
+    for column in available_columns(frozenset(df.columns), GRADIENT_COLUMNS):
+        values = df[column]
+        if not pd.api.types.is_numeric_dtype(values):
+            continue
+        df[column] = pd.to_numeric(values, downcast="unsigned" if values.min() >= 0 else "integer")
+    return df
 
-def yes_no_colors(val: str) -> str:
-    """Return CSS background colors for Yes/No cells."""
-    if val == "Yes":
-        return "background-color:#b7f4c7"
-    if val == "No":
-        return "background-color:#ffd6cf"
-    return ""
-
-
-def style_dataframe(df: pd.DataFrame) -> pd.io.formats.style.Styler:
-    """Return a styled DataFrame with gradients and Yes/No highlighting."""
-    styler = (
-        df.style.set_caption("Mobility Apps - Tracker & Permission Overview")
-        .format(na_rep="-")
-        .set_properties(**{"text-align": "center", "border": "1px solid #ccc", "padding": "6px"})
-        .set_table_styles(
-            (
-                {
-                    "selector": "caption",
-                    "props": (
-                        ("caption-side", "top"),
-                        ("font-size", "16px"),
-                        ("font-weight", "bold"),
-                        ("padding", "8px"),
-                    ),
-                },
-            )
-        )
-        .background_gradient(subset=available_columns(df, GRADIENT_COLUMNS), cmap="OrRd")
-    )
-
-    for column in available_columns(df, YES_NO_COLUMNS):
-        styler = styler.map(yes_no_colors, subset=[column])
-
-    return styler
 
+def build_dataframe(excel_source: Path) -> pd.DataFrame:
+    """Create the pandas DataFrame, preferring a fresh Parquet cache of the sheet.
+
+    The columnar sidecar is used while it is at least as new as the workbook;
+    otherwise the workbook is parsed and the cache refreshed. Caching is
+    best-effort: a missing Parquet engine, an unreadable sidecar or a sheet
+    the engine cannot convert (e.g. mixed-type columns) just skips the cache.
+    """
+    parquet = parquet_sidecar(excel_source)
+    if parquet.exists() and parquet.stat().st_mtime >= excel_source.stat().st_mtime:
+        try:
+            return pd.read_parquet(parquet)
+        except Exception:  # pragma: no cover - depends on local environment
+            pass
+
+    df = read_workbook(excel_source)
+    # Write to a temporary file and move it into place so an interrupted
+    # write never leaves a truncated sidecar that looks fresh.
+    partial = parquet.with_name(f"{parquet.name}.{os.getpid()}.tmp")
+    try:
+        df.to_parquet(partial, compression="zstd", index=False)
+        os.replace(partial, parquet)
+    except Exception:  # pragma: no cover - depends on local environment
+        partial.unlink(missing_ok=True)
+    return df
+
+
+def parse_yes_no_columns(df: pd.DataFrame, present: AbstractSet[str]) -> pd.DataFrame:
+    """Convert the Yes/No columns to nullable booleans in place, once, after loading."""
+    for column in available_columns(present, YES_NO_COLUMNS):
+        df[column] = yes_no_series(df[column])
+    return df
+
+
+def yes_no_labels(flags: pd.Series, raw: pd.Series) -> np.ndarray:
+    """Turn a boolean Yes/No column back into its "Yes"/"No" labels.
+
+    Cells that did not resolve to a flag keep their original value from
+    ``raw`` (blank cells, "N/A", ...), so no source text is lost.
+    """
+    labels = np.where(flags.fillna(False).to_numpy(dtype=bool), "Yes", "No").astype(object)
+    unresolved = flags.isna().to_numpy()
+    labels[unresolved] = raw.to_numpy(dtype=object)[unresolved]
+    return labels
+
+
+def yes_no_classes(flags: pd.Series) -> np.ndarray:
+    """Return the CSS class for each cell of a boolean Yes/No column; missing cells get none."""
+    classes = np.where(flags.fillna(False).to_numpy(dtype=bool), "yes", "no")
+    classes[flags.isna().to_numpy()] = ""
+    return classes
+
+
+def gradient_css_table(cmap_name: str) -> np.ndarray:
+    """Precompute one CSS declaration per colormap entry.
+
+    Text switches to a light color on dark backgrounds using the same W3C
+    relative-luminance threshold as ``Styler.background_gradient``.
+    """
+    cmap = plt.colormaps[cmap_name]
+    rgba = cmap(np.arange(cmap.N))
+    rgb = rgba[:, :3]
+    linear = np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    luminance = linear @ np.array([0.2126, 0.7152, 0.0722])
+    return np.array(
+        [
+            f"background-color: {to_hex(color)}; color: {'#f1f1f1' if dark else '#000000'};"
+            for color, dark in zip(rgba, luminance < 0.408)
+        ]
+    )
 
-def save_html(styled: pd.io.formats.style.Styler, destination: Path) -> None:
-    """Persist the styled DataFrame to an HTML file."""
-    destination.write_text(styled.to_html(), encoding="utf-8")
 
+GRADIENT_CSS = gradient_css_table("OrRd")
+
+
+def gradient_classes(column: pd.Series) -> np.ndarray:
+    """Bucket a numeric column onto the OrRd gradient as ``g<index>`` CSS classes."""
+    values = column.to_numpy(dtype=float, na_value=np.nan)
+    missing = np.isnan(values)
+    if missing.all():
+        return np.full(len(values), "", dtype="<U4")
+
+    low, high = np.nanmin(values), np.nanmax(values)
+    scaled = (values - low) / (high - low) if high > low else np.zeros_like(values)
+    # Same bucketing as Colormap.__call__ on floats in [0, 1].
+    index = np.clip(np.nan_to_num(scaled) * len(GRADIENT_CSS), 0, len(GRADIENT_CSS) - 1).astype(int)
+    return np.where(missing, "", np.char.add("g", index.astype(str)))
+
+
+def cell_classes(df: pd.DataFrame, present: AbstractSet[str]) -> np.ndarray:
+    """Return a (rows, columns) array with the CSS class of every table cell."""
+    classes = np.full(df.shape, "", dtype="<U4")
+    for column in available_columns(present, GRADIENT_COLUMNS):
+        classes[:, df.columns.get_loc(column)] = gradient_classes(df[column])
+    for column in available_columns(present, YES_NO_COLUMNS):
+        classes[:, df.columns.get_loc(column)] = yes_no_classes(df[column])
+    return classes
+
+
+def display_frame(df: pd.DataFrame, raw: pd.DataFrame, present: AbstractSet[str]) -> pd.DataFrame:
+    """Return the text shown in each table cell, computed column-wise.
+
+    Missing values become "-", Yes/No flags get their labels back (unresolved
+    cells show their original text from ``raw``) and floats keep six
+    decimals. The numeric DataFrame is left untouched for plotting.
+    """
+    display = df.astype(object).where(df.notna(), "-")
+    for column in df.columns[[dtype.kind == "f" for dtype in df.dtypes]]:
+        filled = df[column].notna().to_numpy()
+        display.loc[filled, column] = np.char.mod("%.6f", df[column].to_numpy()[filled])
+    for column in available_columns(present, YES_NO_COLUMNS):
+        original = raw[column].where(raw[column].notna(), "-")
+        display[column] = yes_no_labels(df[column], original)
+    return display.astype(str)
+
+
+def render_html(df_display: pd.DataFrame, classes: np.ndarray) -> str:
+    """Render the summary table as standalone HTML with gradients and Yes/No highlighting.
+
+    The schema is fixed, so the markup is assembled directly from the cell
+    text in ``df_display`` and the matching ``classes`` array: every cell
+    gets at most one CSS class and only the gradient buckets in use are
+    emitted in the stylesheet.
+    """
+    used_buckets = sorted(int(name[1:]) for name in np.unique(classes) if name.startswith("g"))
+    css = [
+        "#T_summary caption {caption-side: top; font-size: 16px; font-weight: bold; padding: 8px;}",
+        "#T_summary td {text-align: center; border: 1px solid #ccc; padding: 6px;}",
+        "#T_summary td.yes {background-color: #b7f4c7;}",
+        "#T_summary td.no {background-color: #ffd6cf;}",
+        *(f"#T_summary td.g{bucket} {{{GRADIENT_CSS[bucket]}}}" for bucket in used_buckets),
+    ]
 
-def save_excel(df: pd.DataFrame, destination: Path) -> None:
-    """Persist the plain DataFrame to Excel for sharing."""
-    df.to_excel(destination, index=False)
+    header = "".join(
+        f'<th class="col_heading level0 col{j}">{html.escape(str(column))}</th>'
+        for j, column in enumerate(df_display.columns)
+    )
+    body = "\n".join(
+        f'    <tr><th class="row_heading level0 row{i}">{html.escape(str(label))}</th>'
+        + "".join(
+            f'<td class="{cls}">{html.escape(text)}</td>' if cls else f"<td>{html.escape(text)}</td>"
+            for text, cls in zip(row, classes[i])
+        )
+        + "</tr>"
+        for i, (label, *row) in enumerate(df_display.itertuples(index=True))
+    )
+    return (
+        '<style type="text/css">\n'
+        + "\n".join(css)
+        + '\n</style>\n<table id="T_summary">\n'
+        + "  <caption>Mobility Apps - Tracker &amp; Permission Overview</caption>\n"
+        + f'  <thead>\n    <tr><th class="blank level0">&nbsp;</th>{header}</tr>\n  </thead>\n'
+        + f"  <tbody>\n{body}\n  </tbody>\n</table>\n"
+    )
 
 
-def plot_trackers_by_app(df: pd.DataFrame, destination: Path) -> Path | None:
-    if "Nb_Trackers" not in df.columns:
+def dataframe_digest(df: pd.DataFrame) -> str:
+    """Return a content hash covering the column names and every cell."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update("\x1f".join(map(str, df.columns)).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def save_html(
+    df: pd.DataFrame, raw: pd.DataFrame, present: AbstractSet[str], destination: Path
+) -> bool:
+    """Persist the styled DataFrame to an HTML file.
+
+    A ``.hash`` sidecar records the content hash of the sheet that was
+    rendered; when it matches and the HTML file still exists, rendering is
+    skipped. Returns whether the HTML file was (re)written.
+    """
+    # Hash the Yes/No columns as loaded: unresolved cells all share the same
+    # missing flag but are rendered with their own text.
+    digest = dataframe_digest(df.assign(**raw))
+    sidecar = destination.with_suffix(".hash")
+    if destination.exists() and sidecar.exists() and sidecar.read_text(encoding="utf-8") == digest:
+        return False
+
+    destination.write_text(render_html(display_frame(df, raw, present), cell_classes(df, present)), encoding="utf-8")
+    sidecar.write_text(digest, encoding="utf-8")
+    return True
+
+
+def save_excel(
+    df: pd.DataFrame, raw: pd.DataFrame, present: AbstractSet[str], destination: Path
+) -> None:
+    """Persist the plain DataFrame to Excel for sharing, with Yes/No labels restored.
+
+    Yes/No cells that did not resolve are written back with their original
+    value from ``raw``, since the output may overwrite the source workbook.
+
+    With xlsxwriter installed, rows are streamed in ``constant_memory`` mode so
+    only the current row is held in memory; otherwise pandas' default engine
+    is used.
+    """
+    yes_no_cols = available_columns(present, YES_NO_COLUMNS)
+    labels = {column: yes_no_labels(df[column], raw[column]) for column in yes_no_cols}
+    frame = df.assign(**labels)
+    try:
+        import xlsxwriter
+    except ImportError:
+        frame.to_excel(destination, index=False)
+        return
+
+    # constant_memory flushes each row once a later row is started, so cells
+    # must be written row by row; DataFrame.to_excel emits them column by
+    # column and would silently drop data in this mode.
+    # default_date_format matches pandas' to_excel so dates stay real dates
+    # rather than bare serial numbers.
+    workbook = xlsxwriter.Workbook(
+        str(destination),
+        {"constant_memory": True, "default_date_format": "yyyy-mm-dd hh:mm:ss"},
+    )
+    try:
+        sheet = workbook.add_worksheet("Sheet1")
+        # Same header look as pandas' default to_excel output.
+        header_format = workbook.add_format(
+            {"bold": True, "border": 1, "align": "center", "valign": "top"}
+        )
+        sheet.write_row(0, 0, [str(column) for column in frame.columns], header_format)
+        for row_number, row in enumerate(frame.itertuples(index=False, name=None), start=1):
+            sheet.write_row(row_number, 0, [None if pd.isna(value) else value for value in row])
+    finally:
+        workbook.close()
+
+
+def save_figure(fig: plt.Figure, destination: Path, dpi: int) -> None:
+    """Write a figure to disk; SVG destinations are vector, so DPI is ignored.
+
+    PNGs are printed straight from the figure's Agg canvas, bypassing the
+    format dispatch and backend switching that ``Figure.savefig`` performs.
+    """
+    if destination.suffix == ".svg":
+        fig.savefig(destination)
+        return
+
+    canvas = fig.canvas if isinstance(fig.canvas, FigureCanvasAgg) else FigureCanvasAgg(fig)
+    # Like savefig, only the output uses the requested DPI; restoring the
+    # figure's own DPI keeps tight_layout identical on a reused figure.
+    layout_dpi = fig.dpi
+    fig.set_dpi(dpi)
+    try:
+        canvas.print_png(destination, pil_kwargs={"optimize": True})
+    finally:
+        fig.set_dpi(layout_dpi)
+
+
+def plot_trackers_by_app(
+    df: pd.DataFrame,
+    present: AbstractSet[str],
+    ax: plt.Axes,
+    destination: Path,
+    dpi: int = 150,
+) -> Path | None:
+    if "Nb_Trackers" not in present:
         return None
 
-    ordered = df.sort_values("Nb_Trackers", ascending=True)
-    fig, ax = plt.subplots(figsize=(10, 6))
-    ax.barh(ordered["App_Name"], ordered["Nb_Trackers"], color="#1f77b4")
+    # Bars follow the row order; create_plots passes rows pre-sorted by tracker count.
+    fig = ax.figure
+    fig.set_size_inches(10, 6)
+    ax.barh(df["App_Name"], df["Nb_Trackers"], color="#1f77b4")
     ax.set_xlabel("Number of embedded trackers")
     ax.set_ylabel("Application")
     ax.set_title("Tracker count per mobility app")
     ax.grid(axis="x", alpha=0.2, linestyle="--")
     fig.tight_layout()
-    fig.savefig(destination, dpi=300)
-    plt.close(fig)
+    save_figure(fig, destination, dpi)
     return destination
 
 
-def plot_permission_totals(df: pd.DataFrame, destination: Path) -> Path | None:
-    needed = available_columns(df, ["Nb_Permissions", "Nb_Dangerous_Permissions"])
+def plot_permission_totals(
+    df: pd.DataFrame,
+    present: AbstractSet[str],
+    ax: plt.Axes,
+    destination: Path,
+    dpi: int = 150,
+) -> Path | None:
+    needed = available_columns(present, ["Nb_Permissions", "Nb_Dangerous_Permissions"])
     if len(needed) < 2:
         return None
 
     x = np.arange(len(df))
     width = 0.4
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig = ax.figure
+    fig.set_size_inches(12, 6)
     ax.bar(x - width / 2, df["Nb_Permissions"], width=width, label="Total permissions", color="#aec7e8")
     ax.bar(
         x + width / 2,
@@ -139,70 +479,95 @@ def plot_permission_totals(df: pd.DataFrame, destination: Path) -> Path | None:
         label="Dangerous permissions",
         color="#ff9896",
     )
-    ax.set_xticks(x)
-    ax.set_xticklabels(df["App_Name"], rotation=45, ha="right")
+    ax.set_xticks(x, labels=df["App_Name"], rotation=45, ha="right")
     ax.set_ylabel("Count")
     ax.set_title("Declared permissions vs dangerous subset")
     ax.legend()
     ax.grid(axis="y", alpha=0.2, linestyle="--")
     fig.tight_layout()
-    fig.savefig(destination, dpi=300)
-    plt.close(fig)
+    save_figure(fig, destination, dpi)
     return destination
 
 
-def plot_average_scores(df: pd.DataFrame, destination: Path) -> Path | None:
-    cols = available_columns(df, SCORE_COLUMNS)
+def plot_average_scores(
+    df: pd.DataFrame,
+    present: AbstractSet[str],
+    ax: plt.Axes,
+    destination: Path,
+    dpi: int = 150,
+) -> Path | None:
+    cols = available_columns(present, SCORE_COLUMNS)
     if not cols:
         return None
 
     means = df[cols].mean().sort_values(ascending=True)
-    fig, ax = plt.subplots(figsize=(8, 5))
-    ax.barh(means.index, means.values, color="#c5b0d5")
+    fig = ax.figure
+    fig.set_size_inches(8, 5)
+    bars = ax.barh(means.index, means.values, color="#c5b0d5")
     ax.set_xlabel("Average score (0-5)")
     ax.set_title("Average privacy/transparency scores across apps")
     ax.set_xlim(0, 5)
-    for i, value in enumerate(means.values):
-        ax.text(value + 0.05, i, f"{value:.1f}", va="center", fontsize=9)
+    ax.bar_label(bars, fmt="%.1f", padding=3, fontsize=9)
     fig.tight_layout()
-    fig.savefig(destination, dpi=300)
-    plt.close(fig)
+    save_figure(fig, destination, dpi)
     return destination
 
 
-def plot_permission_usage(df: pd.DataFrame, destination: Path) -> Path | None:
-    cols = available_columns(df, YES_NO_COLUMNS)
+def plot_permission_usage(
+    df: pd.DataFrame,
+    present: AbstractSet[str],
+    ax: plt.Axes,
+    destination: Path,
+    dpi: int = 150,
+) -> Path | None:
+    cols = available_columns(present, YES_NO_COLUMNS)
     if not cols:
         return None
 
-    yes_counts = [yes_no_series(df[col]).sum() for col in cols]
-    fig, ax = plt.subplots(figsize=(10, 5))
-    ax.bar(cols, yes_counts, color="#98df8a")
+    # Missing flags count as "not requested"; the counts are then a single
+    # strided sum over a byte array.
+    yes_counts = df[cols].fillna(False).to_numpy(dtype=np.uint8).sum(axis=0)
+    fig = ax.figure
+    fig.set_size_inches(10, 5)
+    bars = ax.bar(cols, yes_counts, color="#98df8a")
     ax.set_ylabel("Number of apps requesting permission")
     ax.set_title("Prevalence of sensitive permissions across apps")
     ax.set_ylim(0, len(df) + 1)
-    ax.set_xticklabels(cols, rotation=45, ha="right")
-    for idx, count in enumerate(yes_counts):
-        ax.text(idx, count + 0.1, str(count), ha="center", va="bottom")
+    ax.set_xticks(np.arange(len(cols)), labels=cols, rotation=45, ha="right")
+    ax.bar_label(bars, padding=3)
     fig.tight_layout()
-    fig.savefig(destination, dpi=300)
-    plt.close(fig)
+    save_figure(fig, destination, dpi)
     return destination
 
 
-def plot_category_scores(df: pd.DataFrame, destination: Path) -> Path | None:
-    if "Category" not in df.columns:
+def plot_category_scores(
+    df: pd.DataFrame,
+    present: AbstractSet[str],
+    ax: plt.Axes,
+    destination: Path,
+    dpi: int = 150,
+) -> Path | None:
+    if "Category" not in present:
         return None
 
-    cols = available_columns(df, SCORE_COLUMNS)
+    cols = available_columns(present, SCORE_COLUMNS)
     if not cols:
         return None
 
-    grouped = df.groupby("Category")[cols].median().sort_values(by=cols[0], ascending=False)
+    # Grouping on categorical codes avoids hashing the category strings; the
+    # categories are already sorted, so group order matches a string groupby.
+    categories = df["Category"].astype("category")
+    grouped = (
+        df[cols]
+        .groupby(categories, observed=True)
+        .median()
+        .sort_values(by=cols[0], ascending=False)
+    )
 
     x = np.arange(len(grouped.index))
     width = 0.15
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig = ax.figure
+    fig.set_size_inches(12, 6)
 
     for i, col in enumerate(cols):
         offset = (i - (len(cols) - 1) / 2) * width
@@ -213,8 +578,7 @@ def plot_category_scores(df: pd.DataFrame, destination: Path) -> Path | None:
             label=col.replace("_0to5", "").replace("_", " "),
         )
 
-    ax.set_xticks(x)
-    ax.set_xticklabels(grouped.index, rotation=20, ha="right")
+    ax.set_xticks(x, labels=grouped.index, rotation=20, ha="right")
     ax.set_ylabel("Median score (0-5 scale)")
     ax.set_title("Median risk/transparency scores by category")
     ax.set_ylim(0, 5)
@@ -222,21 +586,77 @@ def plot_category_scores(df: pd.DataFrame, destination: Path) -> Path | None:
     ax.grid(axis="y", alpha=0.2, linestyle="--")
 
     fig.tight_layout()
-    fig.savefig(destination, dpi=300)
-    plt.close(fig)
+    save_figure(fig, destination, dpi)
     return destination
 
 
-def create_plots(df: pd.DataFrame, output_dir: Path) -> List[Path]:
+_PLOT_FIGURE: Figure | None = None
+
+
+def _render_plot(
+    plot: Callable[[pd.DataFrame, AbstractSet[str], plt.Axes, Path, int], Path | None],
+    data: pd.DataFrame,
+    present: AbstractSet[str],
+    destination: Path,
+    dpi: int,
+) -> Path | None:
+    """Draw one plot on this process's shared figure.
+
+    Each process keeps a single figure alive and reuses it for every plot it
+    renders. The axes and the margins left behind by tight_layout are reset
+    first so no state leaks from the previous chart.
+    """
+    global _PLOT_FIGURE
+    if _PLOT_FIGURE is None:
+        _PLOT_FIGURE = Figure()
+        FigureCanvasAgg(_PLOT_FIGURE)
+        _PLOT_FIGURE.add_subplot()
+    fig = _PLOT_FIGURE
+    ax = fig.axes[0]
+    ax.clear()
+    fig.subplots_adjust(**DEFAULT_SUBPLOT_MARGINS)
+    return plot(data, present, ax, destination, dpi)
+
+
+def create_plots(
+    df: pd.DataFrame,
+    output_dir: Path,
+    dpi: int = 150,
+    plot_format: str = "png",
+    max_workers: int | None = None,
+) -> List[Path]:
     """Generate a suite of plots that summarize the sheet."""
     output_dir.mkdir(parents=True, exist_ok=True)
-    generated: List[Path | None] = [
-        plot_trackers_by_app(df, output_dir / "trackers_by_app.png"),
-        plot_permission_totals(df, output_dir / "permissions_vs_dangerous.png"),
-        plot_average_scores(df, output_dir / "average_scores.png"),
-        plot_permission_usage(df, output_dir / "permission_usage.png"),
-        plot_category_scores(df, output_dir / "category_scores.png"),
+    suffix = f".{plot_format}"
+    # Every plot checks its columns against the same set, built once here.
+    present = frozenset(df.columns)
+    by_trackers = df
+    if "Nb_Trackers" in present:
+        by_trackers = df.iloc[np.argsort(df["Nb_Trackers"].to_numpy(), kind="stable")]
+    jobs = [
+        (plot_trackers_by_app, by_trackers, f"trackers_by_app{suffix}"),
+        (plot_permission_totals, df, f"permissions_vs_dangerous{suffix}"),
+        (plot_average_scores, df, f"average_scores{suffix}"),
+        (plot_permission_usage, df, f"permission_usage{suffix}"),
+        (plot_category_scores, df, f"category_scores{suffix}"),
     ]
+
+    if max_workers is None:
+        max_workers = min(len(jobs), os.cpu_count() or 1)
+
+    # The plots are independent and CPU-bound in the Agg renderer, so they are
+    # spread across processes; a single worker renders them in-process.
+    if max_workers <= 1:
+        generated = [
+            _render_plot(plot, data, present, output_dir / name, dpi) for plot, data, name in jobs
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_render_plot, plot, data, present, output_dir / name, dpi)
+                for plot, data, name in jobs
+            ]
+            generated = [future.result() for future in futures]
     return [path for path in generated if path is not None]
 
 
@@ -267,29 +687,58 @@ def parse_args(argv: Iterable[str] | None = None):
         "--plots-dir",
         type=Path,
         default=Path("plots"),
-        help="Directory in which to store generated PNG visualizations.",
+        help="Directory in which to store generated plot images.",
+    )
+    parser.add_argument(
+        "--plot-format",
+        choices=("png", "svg"),
+        default="png",
+        help="Image format for generated plots (SVG is vector and skips rasterization).",
+    )
+    parser.add_argument(
+        "--dpi",
+        type=int,
+        default=150,
+        help="Resolution used when rasterizing PNG plots.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of processes used to render plots (default: one per plot, capped at CPU count).",
     )
     parser.add_argument("--skip-html", action="store_true", help="Skip generating HTML output.")
     parser.add_argument("--skip-excel", action="store_true", help="Skip generating Excel output.")
-    parser.add_argument("--skip-plots", action="store_true", help="Skip generating PNG plots.")
+    parser.add_argument("--skip-plots", action="store_true", help="Skip generating plot images.")
     return parser.parse_args(argv)
 
 
 def main() -> None:
     args = parse_args()
     df = build_dataframe(args.excel_in)
-    styled = style_dataframe(df)
+    present = frozenset(df.columns)
+    # Keep the Yes/No columns as loaded so the writers can restore cells that
+    # are neither "Yes" nor "No" instead of dropping them.
+    raw = df[available_columns(present, YES_NO_COLUMNS)]
+    df = parse_yes_no_columns(df, present)
 
     if not args.skip_html:
-        save_html(styled, args.html_out)
-        print(f"Wrote styled HTML table to {args.html_out.resolve()}")
+        if save_html(df, raw, present, args.html_out):
+            print(f"Wrote styled HTML table to {args.html_out.resolve()}")
+        else:
+            print(f"Styled HTML table at {args.html_out.resolve()} is up to date")
 
     if not args.skip_excel:
-        save_excel(df, args.excel_out)
+        save_excel(df, raw, present, args.excel_out)
         print(f"Wrote DataFrame to Excel at {args.excel_out.resolve()}")
+        # Rewriting the source workbook with the same data would otherwise
+        # make its Parquet cache look stale on the next run.
+        parquet = parquet_sidecar(args.excel_in)
+        if args.excel_out.resolve() == args.excel_in.resolve() and parquet.exists():
+            parquet.touch()
 
     if not args.skip_plots:
-        generated = create_plots(df, args.plots_dir)
+        generated = create_plots(df, args.plots_dir, args.dpi, args.plot_format, args.jobs)
         if generated:
             for path in generated:
                 print(f"Saved plot -> {path.resolve()}")